@@ -8,23 +8,176 @@ Users can provide their API key via (in order of precedence):
 3. The NEWSCATCHER_API_KEY environment variable
 """
 
+import asyncio
 import contextvars
-import json
+import functools
+import hashlib
+import logging
+import math
 import os
+import random
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Any
+from urllib.parse import unquote_plus
 
 import httpx
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server.middleware import Middleware, MiddlewareContext
-from fastmcp.server.dependencies import get_http_request
 
 # Context variable to store the API key from URL for the current session
 session_api_key: contextvars.ContextVar[str] = contextvars.ContextVar("session_api_key", default="")
 
+logger = logging.getLogger(__name__)
+
 # API Configuration
 API_BASE_URL = "https://catchall.newscatcherapi.com"
 
 
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to default if unset or invalid."""
+    value = os.environ.get(name, "")
+    if not value:
+        return default
+    try:
+        parsed = float(value)
+        if math.isfinite(parsed):
+            return parsed
+    except ValueError:
+        pass
+    logger.warning("Ignoring invalid %s=%r, using %s", name, value, default)
+    return default
+
+
+# Fallback API key, read once at startup rather than on every request
+ENV_API_KEY = os.environ.get("NEWSCATCHER_API_KEY", "")
+
+# Matches the apiKey parameter in a raw ASGI query string
+API_KEY_QUERY_RE = re.compile(rb"(?:^|&)apiKey=([^&]*)")
+
+# Keys checked, in order, for a human-readable message in API error bodies
+ERROR_MESSAGE_KEYS = ("detail", "error", "message")
+
+
+def extract_error_message(response: httpx.Response) -> str:
+    """Build a readable error message from a failed API response."""
+    # Parse the raw bytes directly; some error pages omit the JSON content type
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        data = None
+
+    if isinstance(data, dict):
+        detail = next((data[k] for k in ERROR_MESSAGE_KEYS if k in data), None)
+        if detail is None:
+            return orjson.dumps(data).decode()
+        if isinstance(detail, dict):
+            return str(detail.get("detail", detail))
+        return str(detail)
+    if data is not None:
+        return str(data)
+    return response.text or f"HTTP {response.status_code}"
+
+
+class NewscatcherAPIError(ValueError):
+    """Raised when the CatchAll API responds with an error status code."""
+
+    def __init__(self, response: httpx.Response, message: str):
+        super().__init__(f"API Error ({response.status_code}): {message}")
+        self.response = response
+        self.status_code = response.status_code
+
+
+async def raise_for_api_error(response: httpx.Response) -> None:
+    """Response hook that raises NewscatcherAPIError for error responses.
+
+    Keeping this in a hook means the success path in make_api_request never
+    branches on the status code.
+    """
+    if response.status_code >= 400:
+        await response.aread()
+        raise NewscatcherAPIError(response, extract_error_message(response))
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the HTTP client shared by all tool calls.
+
+    Connections (and their TLS sessions) are kept alive instead of being
+    re-established per request. HTTP/2 lets concurrent tool calls multiplex over
+    a single connection, and the transport retries failed connection attempts.
+    """
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        timeout=60.0,
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        },
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+            retries=3,
+        ),
+        event_hooks={"response": [raise_for_api_error]},
+    )
+
+
+# Shared HTTP client, closed by the server lifespan and rebuilt if it runs again
+http_client = create_http_client()
+
+# Retry policy. A 429 means the request was rejected unprocessed, so it is retried
+# for any method. Gateway/unavailable errors may hide a request the API did
+# process, so they are only retried for idempotent methods.
+RATE_LIMIT_STATUS_CODES = frozenset({429})
+TRANSIENT_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET"})
+MAX_ATTEMPTS = 4
+RETRY_MAX_DELAY = 30.0
+
+# Short-lived cache for the read-only polling endpoints. Entries are keyed by
+# a hash of the API key so cached responses are never shared between users.
+# NEWSCATCHER_STATUS_CACHE_TTL sets how long an in-progress job status is reused
+# (0 disables it); completed/failed statuses and the job list keep their own TTLs.
+STATUS_CACHE_TTL = env_float("NEWSCATCHER_STATUS_CACHE_TTL", 2.0)
+TERMINAL_STATUS_CACHE_TTL = 300.0
+JOBS_CACHE_TTL = 10.0
+RESPONSE_CACHE_MAXSIZE = 4096
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed"})
+
+response_cache: dict[tuple[str, ...], tuple[float, Any]] = {}
+
+# Polling schedule for wait_for_job: exponential backoff with jitter
+POLL_BASE_DELAY = 2.0
+POLL_MAX_DELAY = 30.0
+POLL_JITTER = 1.0
+# Longest wait_for_job will block; larger max_wait values are clamped to this
+POLL_MAX_WAIT = 600.0
+# Largest backoff exponent still below POLL_MAX_DELAY, so 2**attempt stays bounded
+POLL_MAX_ATTEMPT = math.ceil(math.log2(POLL_MAX_DELAY / POLL_BASE_DELAY))
+
+# Concurrency and page size used by pull_all_results
+PULL_CONCURRENCY = 8
+PULL_PAGE_SIZE = 100
+
+# Identical submit_query calls within this many seconds share a single job
+SUBMIT_COALESCE_WINDOW = 2.0
+
+inflight_submits: dict[tuple[str, str], asyncio.Task] = {}
+
+# Article fields kept by pull_results_compact, stored as one list per field.
+# Results are a list of clusters, each holding its own list of articles.
+COMPACT_FIELDS = ("title", "url", "cluster_id", "published_at")
+RESULT_CLUSTERS_KEY = "clusters"
+CLUSTER_ARTICLES_KEY = "articles"
+
+
 class ApiKeyMiddleware(Middleware):
     """Middleware to extract API key from URL query parameters.
 
@@ -37,15 +190,40 @@ class ApiKeyMiddleware(Middleware):
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Extract API key from HTTP request query params before tool execution."""
+        # The request context only carries an HTTP request when served over HTTP
+        # (it is None under stdio), so check for it instead of catching errors.
+        request_context = context.fastmcp_context.request_context if context.fastmcp_context else None
+        request = request_context.request if request_context else None
+        token = None
+        if request is not None:
+            # Scan the raw query string rather than building request.query_params
+            match = API_KEY_QUERY_RE.search(request.scope.get("query_string", b""))
+            api_key = unquote_plus(match.group(1).decode("latin-1")) if match else ""
+            # Only write the contextvar when the key changes, set() allocates a Token
+            if api_key and session_api_key.get() != api_key:
+                token = session_api_key.set(api_key)
         try:
-            request = get_http_request()
-            api_key = request.query_params.get("apiKey", "")
-            if api_key:
-                session_api_key.set(api_key)
-        except Exception:
-            # Not running in HTTP context (e.g., stdio), skip
-            pass
-        return await call_next(context)
+            return await call_next(context)
+        finally:
+            # Restore the previous key so it cannot leak into later tool calls
+            if token is not None:
+                session_api_key.reset(token)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Manage the shared HTTP client for the lifetime of the server.
+
+    The lifespan can run more than once per process (e.g. one in-process client
+    session after another), so a client closed by a previous run is rebuilt.
+    """
+    global http_client
+    if http_client.is_closed:
+        http_client = create_http_client()
+    try:
+        yield
+    finally:
+        await http_client.aclose()
 
 
 # Create the FastMCP server
@@ -57,8 +235,9 @@ IMPORTANT: You need a Newscatcher API key to use these tools. Get one at https:/
 
 Workflow:
 1. Use submit_query to submit your news search query
-2. Use get_job_status to check if processing is complete
+2. Use wait_for_job (or get_job_status for a single check) to wait until processing is complete
 3. Use pull_results to retrieve the clustered news articles""",
+    lifespan=lifespan,
 )
 
 # Add middleware to extract API key from URL query parameters
@@ -83,9 +262,8 @@ def get_api_key(api_key: str = "") -> str:
         return url_key
 
     # Fall back to environment variable
-    env_key = os.environ.get("NEWSCATCHER_API_KEY", "")
-    if env_key:
-        return env_key
+    if ENV_API_KEY:
+        return ENV_API_KEY
 
     raise ValueError(
         "API key is required. Provide it via: "
@@ -95,55 +273,327 @@ def get_api_key(api_key: str = "") -> str:
     )
 
 
+@functools.lru_cache(maxsize=256)
+def auth_headers(api_key: str) -> dict[str, str]:
+    """Return the auth header dict for an API key, reusing it across calls.
+
+    httpx copies request headers, so sharing the same dict is safe.
+    """
+    return {"x-api-key": api_key}
+
+
+def is_retryable(method: str, status_code: int) -> bool:
+    """Return whether a failed request can be safely sent again."""
+    if status_code in RATE_LIMIT_STATUS_CODES:
+        return True
+    return status_code in TRANSIENT_STATUS_CODES and method.upper() in IDEMPOTENT_METHODS
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Return how long to wait before retrying, honoring Retry-After if present."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            # HTTP-date form, fall back to exponential backoff
+            pass
+    return min(RETRY_MAX_DELAY, 0.5 * 2**attempt) + random.random()
+
+
 async def make_api_request(
     api_key: str,
     method: str,
     path: str,
     json_data: dict[str, Any] | None = None,
     params: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    """Make an API request to Newscatcher CatchAll API."""
+    raw: bool = False,
+) -> Any:
+    """Make an API request to Newscatcher CatchAll API.
+
+    With raw=True the response body is returned as text instead of being decoded,
+    which avoids a parse/serialize round-trip for passthrough responses.
+    Error responses raise NewscatcherAPIError from the client's response hook;
+    429s (and, for GETs, transient 502/503/504 errors) are retried with backoff up
+    to MAX_ATTEMPTS times.
+    """
     key = get_api_key(api_key)
+    # Serialize the body once with orjson; the client already sends the JSON Content-Type
+    content = orjson.dumps(json_data) if json_data is not None else None
 
-    headers = {
-        "x-api-key": key,
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = await http_client.request(
+                method=method,
+                url=path,
+                headers=auth_headers(key),
+                content=content,
+                params=params,
+            )
+            break
+        except NewscatcherAPIError as e:
+            if not is_retryable(method, e.status_code) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(retry_delay(e.response, attempt))
+
+    if raw:
+        return response.text
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return {"result": response.text}
 
-    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=60.0) as client:
-        response = await client.request(
-            method=method,
-            url=path,
-            headers=headers,
-            json=json_data,
-            params=params,
-        )
 
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                if isinstance(error_data, dict):
-                    if "detail" in error_data:
-                        detail = error_data["detail"]
-                        if isinstance(detail, dict) and "detail" in detail:
-                            error_msg = detail["detail"]
-                        else:
-                            error_msg = str(detail)
-                    else:
-                        error_msg = json.dumps(error_data)
+def tool_errors(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Decorate a tool so failures are returned as error text instead of raised.
+
+    ValueError covers missing API keys and API error responses; anything else is
+    reported as unexpected.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            return await func(*args, **kwargs)
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Unexpected error: {str(e)}"
+
+    return wrapper
+
+
+def dump_json(data: Any, pretty: bool = False) -> str:
+    """Serialize a tool result to JSON, compact unless pretty is requested."""
+    if pretty:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return orjson.dumps(data).decode()
+
+
+def hash_api_key(api_key: str) -> str:
+    """Return a short, stable digest of an API key for use in cache keys."""
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
+
+def cache_get(key: tuple[str, ...]) -> Any | None:
+    """Return a cached response, or None if it is missing or expired."""
+    entry = response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del response_cache[key]
+        return None
+    return value
+
+
+def cache_set(key: tuple[str, ...], value: Any, ttl: float) -> None:
+    """Store a response for ttl seconds, evicting old entries when full."""
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(response_cache) >= RESPONSE_CACHE_MAXSIZE:
+        expired = [k for k, (expires_at, _) in response_cache.items() if expires_at <= now]
+        for k in expired:
+            del response_cache[k]
+        if len(response_cache) >= RESPONSE_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del response_cache[next(iter(response_cache))]
+    response_cache[key] = (now + ttl, value)
+
+
+def cache_delete(*keys: tuple[str, ...]) -> None:
+    """Drop cached responses made stale by a mutating request."""
+    for key in keys:
+        response_cache.pop(key, None)
+
+
+def job_status(result: Any) -> str:
+    """Return the normalized status field of a job status response."""
+    if isinstance(result, dict):
+        return str(result.get("status", "")).lower()
+    return ""
+
+
+def release_submit(key: tuple[str, str], task: asyncio.Task) -> None:
+    """Forget a finished submission unless a newer one has replaced it."""
+    if inflight_submits.get(key) is task:
+        del inflight_submits[key]
+
+
+async def submit_job(api_key: str, query: str, coalesce: bool = True) -> Any:
+    """Submit a query, sharing one backend job between identical concurrent calls.
+
+    While a submission with the same API key and query is in flight, or finished
+    less than SUBMIT_COALESCE_WINDOW seconds ago, callers get its result instead
+    of creating a duplicate job. Failed submissions are forgotten immediately.
+    """
+    key = get_api_key(api_key)
+    key_hash = hash_api_key(key)
+    if not coalesce:
+        result = await make_api_request(
+            api_key=key,
+            method="POST",
+            path="/catchAll/submit",
+            json_data={"query": query},
+        )
+    else:
+        inflight_key = (key_hash, query)
+        task = inflight_submits.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                make_api_request(
+                    api_key=key,
+                    method="POST",
+                    path="/catchAll/submit",
+                    json_data={"query": query},
+                )
+            )
+            inflight_submits[inflight_key] = task
+
+            def on_done(done: asyncio.Task) -> None:
+                if done.cancelled() or done.exception() is not None:
+                    release_submit(inflight_key, done)
                 else:
-                    error_msg = str(error_data)
-            except Exception:
-                error_msg = response.text or f"HTTP {response.status_code}"
+                    asyncio.get_running_loop().call_later(SUBMIT_COALESCE_WINDOW, release_submit, inflight_key, done)
 
-            raise ValueError(f"API Error ({response.status_code}): {error_msg}")
+            task.add_done_callback(on_done)
 
-        return response.json()
+        # Shield the shared task so one caller being cancelled doesn't cancel it for the others
+        result = await asyncio.shield(task)
+
+    # The new job makes the cached job list stale
+    cache_delete((key_hash, "jobs"))
+    return result
+
+
+async def fetch_job_status(api_key: str, job_id: str, use_cache: bool = True) -> dict[str, Any]:
+    """Fetch a job's status, serving repeated polls from the response cache.
+
+    Jobs in a terminal state are cached for longer since they no longer change.
+    With use_cache=False the API is always queried, but the cache is still refreshed.
+    """
+    key = get_api_key(api_key)
+    cache_key = (hash_api_key(key), "status", job_id)
+    result = cache_get(cache_key) if use_cache else None
+    if result is None:
+        result = await make_api_request(
+            api_key=key,
+            method="GET",
+            path=f"/catchAll/status/{job_id}",
+        )
+        ttl = TERMINAL_STATUS_CACHE_TTL if job_status(result) in TERMINAL_JOB_STATUSES else STATUS_CACHE_TTL
+        cache_set(cache_key, result, ttl)
+    return result
+
+
+async def await_completion(api_key: str, job_id: str, max_wait: float) -> dict[str, Any]:
+    """Poll a job until it reaches a terminal status or max_wait seconds pass.
+
+    Sleeps with exponential backoff and jitter between polls. If the API reports
+    an eta_seconds estimate, the next poll is scheduled at half the ETA instead.
+    max_wait must be a finite, non-negative number and is clamped to POLL_MAX_WAIT.
+    """
+    if not math.isfinite(max_wait) or max_wait < 0:
+        raise ValueError(f"max_wait must be a non-negative number of seconds, got {max_wait}")
+    deadline = time.monotonic() + min(max_wait, POLL_MAX_WAIT)
+    attempt = 0
+    while True:
+        # Bypass the cache: an ETA-driven delay can be shorter than STATUS_CACHE_TTL,
+        # and a cached status would make the loop spin without reaching the API.
+        result = await fetch_job_status(api_key, job_id, use_cache=False)
+        remaining = deadline - time.monotonic()
+        if job_status(result) in TERMINAL_JOB_STATUSES or remaining <= 0:
+            return result
+
+        eta = result.get("eta_seconds") if isinstance(result, dict) else None
+        if isinstance(eta, (int, float)) and eta > 0:
+            delay = max(1.0, eta * 0.5)
+        else:
+            delay = min(POLL_MAX_DELAY, POLL_BASE_DELAY * 2**attempt + random.uniform(0, POLL_JITTER))
+            attempt = min(attempt + 1, POLL_MAX_ATTEMPT)
+        await asyncio.sleep(min(delay, remaining))
+
+
+async def fetch_all_pages(api_key: str, job_id: str, max_pages: int | None = None) -> Any:
+    """Fetch every results page of a job and merge them into one response.
+
+    Page 1 is fetched first to learn total_pages, then the remaining pages are
+    fetched concurrently (at most PULL_CONCURRENCY at a time). List fields from
+    later pages are appended to those of page 1 in page order.
+    """
+    if max_pages is not None and max_pages < 1:
+        raise ValueError(f"max_pages must be at least 1, got {max_pages}")
+
+    key = get_api_key(api_key)
+    path = f"/catchAll/pull/{job_id}"
+    first = await make_api_request(
+        api_key=key,
+        method="GET",
+        path=path,
+        params={"page": 1, "page_size": PULL_PAGE_SIZE},
+    )
+    if not isinstance(first, dict):
+        return first
+
+    raw_total_pages = first.get("total_pages") or 1
+    try:
+        total_pages = int(raw_total_pages)
+    except (TypeError, ValueError):
+        raise ValueError(f"Unexpected total_pages in API response: {raw_total_pages!r}") from None
+    if max_pages is not None:
+        total_pages = min(total_pages, max_pages)
+
+    semaphore = asyncio.Semaphore(PULL_CONCURRENCY)
+
+    async def fetch_page(page: int) -> Any:
+        async with semaphore:
+            return await make_api_request(
+                api_key=key,
+                method="GET",
+                path=path,
+                params={"page": page, "page_size": PULL_PAGE_SIZE},
+            )
+
+    pages = await asyncio.gather(*(fetch_page(page) for page in range(2, total_pages + 1)))
+
+    merged = {field: list(value) if isinstance(value, list) else value for field, value in first.items()}
+    for page_number, page in enumerate(pages, start=2):
+        if not isinstance(page, dict):
+            raise ValueError(f"Unexpected API response for page {page_number}: expected a JSON object")
+        for field, value in page.items():
+            if isinstance(value, list) and isinstance(merged.get(field), list):
+                merged[field].extend(value)
+    return merged
+
+
+def to_columnar(result: Any) -> dict[str, list[Any]]:
+    """Collect the COMPACT_FIELDS of every article into one list per field.
+
+    Walks each cluster's article list in order. Articles without a cluster_id
+    inherit their cluster's, and other missing fields are filled with None so
+    all columns stay the same length.
+    """
+    columns: dict[str, list[Any]] = {field: [] for field in COMPACT_FIELDS}
+    if not isinstance(result, dict):
+        return columns
+    for cluster in result.get(RESULT_CLUSTERS_KEY) or []:
+        if not isinstance(cluster, dict):
+            continue
+        for article in cluster.get(CLUSTER_ARTICLES_KEY) or []:
+            if not isinstance(article, dict):
+                continue
+            for field in COMPACT_FIELDS:
+                value = article.get(field)
+                if value is None and field == "cluster_id":
+                    value = cluster.get("cluster_id")
+                columns[field].append(value)
+    return columns
 
 
 @mcp.tool()
-async def submit_query(query: str, api_key: str = "") -> str:
+@tool_errors
+async def submit_query(query: str, api_key: str = "", coalesce: bool = True, pretty: bool = False) -> str:
     """
     Submit a natural language query to search for news articles.
 
@@ -153,26 +603,19 @@ async def submit_query(query: str, api_key: str = "") -> str:
     Args:
         query: Natural language query to search for news (e.g., 'Find all M&A deals in tech sector last 7 days')
         api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        coalesce: Reuse the job of an identical query submitted moments ago instead of creating a duplicate (default: True)
+        pretty: Indent the JSON output for human readers (default: False)
 
     Returns:
         JSON with job_id to use for checking status and getting results
     """
-    try:
-        result = await make_api_request(
-            api_key=api_key,
-            method="POST",
-            path="/catchAll/submit",
-            json_data={"query": query},
-        )
-        return json.dumps(result, indent=2)
-    except ValueError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error: {str(e)}"
+    result = await submit_job(api_key, query, coalesce)
+    return dump_json(result, pretty)
 
 
 @mcp.tool()
-async def get_job_status(job_id: str, api_key: str = "") -> str:
+@tool_errors
+async def get_job_status(job_id: str, api_key: str = "", pretty: bool = False) -> str:
     """
     Check the status of a submitted job.
 
@@ -182,25 +625,43 @@ async def get_job_status(job_id: str, api_key: str = "") -> str:
     Args:
         job_id: The job ID returned from submit_query
         api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        pretty: Indent the JSON output for human readers (default: False)
 
     Returns:
         JSON with current job status and progress information
     """
-    try:
-        result = await make_api_request(
-            api_key=api_key,
-            method="GET",
-            path=f"/catchAll/status/{job_id}",
-        )
-        return json.dumps(result, indent=2)
-    except ValueError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error: {str(e)}"
+    result = await fetch_job_status(api_key, job_id)
+    return dump_json(result, pretty)
 
 
 @mcp.tool()
-async def pull_results(job_id: str, api_key: str = "", page: int = 1, page_size: int = 100) -> str:
+@tool_errors
+async def wait_for_job(job_id: str, api_key: str = "", max_wait: float = 120.0, pretty: bool = False) -> str:
+    """
+    Wait for a submitted job to finish processing.
+
+    Use this instead of calling get_job_status in a loop. The job status is polled
+    with exponential backoff until it is completed or failed, or until max_wait
+    seconds have passed.
+
+    Args:
+        job_id: The job ID returned from submit_query
+        api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        max_wait: Maximum number of seconds to wait (default: 120, at most 600)
+        pretty: Indent the JSON output for human readers (default: False)
+
+    Returns:
+        JSON with the last job status seen. If max_wait was reached the job may still be running.
+    """
+    result = await await_completion(api_key, job_id, max_wait)
+    return dump_json(result, pretty)
+
+
+@mcp.tool()
+@tool_errors
+async def pull_results(
+    job_id: str, api_key: str = "", page: int = 1, page_size: int = 100, pretty: bool = False
+) -> str:
     """
     Retrieve the results of a completed job.
 
@@ -212,26 +673,87 @@ async def pull_results(job_id: str, api_key: str = "", page: int = 1, page_size:
         api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
         page: Page number for pagination (default: 1)
         page_size: Number of results per page (default: 100, max: 100)
+        pretty: Indent the JSON output for human readers (default: False)
 
     Returns:
         JSON with clustered news articles, summaries, and metadata
     """
+    result = await make_api_request(
+        api_key=api_key,
+        method="GET",
+        path=f"/catchAll/pull/{job_id}",
+        params={"page": page, "page_size": page_size},
+        raw=True,
+    )
+    if not pretty:
+        return result
     try:
-        result = await make_api_request(
-            api_key=api_key,
-            method="GET",
-            path=f"/catchAll/pull/{job_id}",
-            params={"page": page, "page_size": page_size},
-        )
-        return json.dumps(result, indent=2)
-    except ValueError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        data = orjson.loads(result)
+    except orjson.JSONDecodeError:
+        # Same fallback make_api_request uses for non-JSON success bodies
+        data = {"result": result}
+    return dump_json(data, pretty)
 
 
 @mcp.tool()
-async def list_user_jobs(api_key: str = "") -> str:
+@tool_errors
+async def pull_all_results(job_id: str, api_key: str = "", max_pages: int | None = None, pretty: bool = False) -> str:
+    """
+    Retrieve all result pages of a completed job in a single call.
+
+    Only call this after get_job_status shows the job is complete.
+    Pages are fetched in parallel and merged, so prefer this over calling
+    pull_results once per page.
+
+    Args:
+        job_id: The job ID returned from submit_query
+        api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        max_pages: Maximum number of pages to fetch (default: all pages)
+        pretty: Indent the JSON output for human readers (default: False)
+
+    Returns:
+        JSON with the clustered news articles from every page merged in page order
+    """
+    result = await fetch_all_pages(api_key, job_id, max_pages)
+    return dump_json(result, pretty)
+
+
+@mcp.tool()
+@tool_errors
+async def pull_results_compact(
+    job_id: str, api_key: str = "", max_pages: int | None = None, pretty: bool = False
+) -> str:
+    """
+    Retrieve all articles of a completed job in a compact, columnar form.
+
+    Like pull_all_results, but only keeps each article's title, url, cluster_id
+    and published_at, returned as one list per field. Use this when you only need
+    to scan, filter, or sort articles rather than read their full content.
+
+    Args:
+        job_id: The job ID returned from submit_query
+        api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        max_pages: Maximum number of pages to fetch (default: all pages)
+        pretty: Indent the JSON output for human readers (default: False)
+
+    Returns:
+        JSON with the field names in schema and the article values in articles_columnar,
+        where index i of every list belongs to the same article
+    """
+    merged = await fetch_all_pages(api_key, job_id, max_pages)
+    columns = to_columnar(merged)
+    result = {
+        "job_id": job_id,
+        "count": len(columns[COMPACT_FIELDS[0]]),
+        "schema": list(COMPACT_FIELDS),
+        "articles_columnar": columns,
+    }
+    return dump_json(result, pretty)
+
+
+@mcp.tool()
+@tool_errors
+async def list_user_jobs(api_key: str = "", pretty: bool = False) -> str:
     """
     List all jobs submitted by you.
 
@@ -239,25 +761,27 @@ async def list_user_jobs(api_key: str = "") -> str:
 
     Args:
         api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        pretty: Indent the JSON output for human readers (default: False)
 
     Returns:
         JSON with list of your submitted jobs
     """
-    try:
+    key = get_api_key(api_key)
+    cache_key = (hash_api_key(key), "jobs")
+    result = cache_get(cache_key)
+    if result is None:
         result = await make_api_request(
-            api_key=api_key,
+            api_key=key,
             method="GET",
             path="/catchAll/jobs/user",
         )
-        return json.dumps(result, indent=2)
-    except ValueError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        cache_set(cache_key, result, JOBS_CACHE_TTL)
+    return dump_json(result, pretty)
 
 
 @mcp.tool()
-async def continue_job(job_id: str, api_key: str = "") -> str:
+@tool_errors
+async def continue_job(job_id: str, api_key: str = "", pretty: bool = False) -> str:
     """
     Continue processing a job that needs more data.
 
@@ -266,23 +790,29 @@ async def continue_job(job_id: str, api_key: str = "") -> str:
     Args:
         job_id: The job ID to continue processing
         api_key: Your Newscatcher API key. Optional if NEWSCATCHER_API_KEY env var is set.
+        pretty: Indent the JSON output for human readers (default: False)
 
     Returns:
         JSON confirming the job continuation
     """
-    try:
-        result = await make_api_request(
-            api_key=api_key,
-            method="POST",
-            path="/catchAll/continue",
-            json_data={"job_id": job_id},
-        )
-        return json.dumps(result, indent=2)
-    except ValueError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error: {str(e)}"
+    key = get_api_key(api_key)
+    result = await make_api_request(
+        api_key=key,
+        method="POST",
+        path="/catchAll/continue",
+        json_data={"job_id": job_id},
+    )
+    key_hash = hash_api_key(key)
+    cache_delete((key_hash, "status", job_id), (key_hash, "jobs"))
+    return dump_json(result, pretty)
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows, keep the default event loop
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
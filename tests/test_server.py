@@ -0,0 +1,198 @@
+"""Tests for the Newscatcher CatchAll MCP server helpers."""
+
+import asyncio
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+import server
+
+
+@pytest.fixture(autouse=True)
+def reset_server_state(monkeypatch):
+    """Give every test an empty response cache and no in-flight submissions."""
+    monkeypatch.setattr(server, "response_cache", {})
+    monkeypatch.setattr(server, "inflight_submits", {})
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Replace make_api_request with a stub that answers through a responder.
+
+    Call the fixture with a responder taking the call's arguments as a dict; it may
+    return a value, raise, or return an awaitable. Returns the list of recorded calls.
+    """
+
+    def install(responder):
+        calls = []
+
+        async def make_api_request(api_key, method, path, json_data=None, params=None, raw=False):
+            call = {
+                "api_key": api_key,
+                "method": method,
+                "path": path,
+                "json_data": json_data,
+                "params": params,
+                "raw": raw,
+            }
+            calls.append(call)
+            result = responder(call)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        monkeypatch.setattr(server, "make_api_request", make_api_request)
+        return calls
+
+    return install
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Make asyncio.sleep yield without waiting and record the requested delays."""
+    real_sleep = asyncio.sleep
+    delays = []
+
+    async def no_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(server.asyncio, "sleep", no_sleep)
+    return delays
+
+
+def test_to_columnar_walks_clusters_into_articles():
+    result = {
+        "job_id": "job-1",
+        "clusters": [
+            {
+                "cluster_id": "c1",
+                "summary": "First story",
+                "articles": [
+                    {"title": "A", "url": "https://a.example", "published_at": "2026-01-01"},
+                    {"title": "B", "url": "https://b.example", "cluster_id": "c1-own"},
+                ],
+            },
+            {
+                "cluster_id": "c2",
+                "articles": [
+                    {"title": "C", "url": "https://c.example", "published_at": "2026-01-03"},
+                ],
+            },
+        ],
+    }
+
+    columns = server.to_columnar(result)
+
+    assert columns == {
+        "title": ["A", "B", "C"],
+        "url": ["https://a.example", "https://b.example", "https://c.example"],
+        "cluster_id": ["c1", "c1-own", "c2"],
+        "published_at": ["2026-01-01", None, "2026-01-03"],
+    }
+
+
+def test_to_columnar_ignores_malformed_results():
+    assert server.to_columnar([]) == {field: [] for field in server.COMPACT_FIELDS}
+    columns = server.to_columnar({"clusters": [None, {"cluster_id": "c1"}, {"articles": ["x"]}]})
+    assert columns == {field: [] for field in server.COMPACT_FIELDS}
+
+
+def test_env_float_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("NEWSCATCHER_STATUS_CACHE_TTL", "abc")
+    assert server.env_float("NEWSCATCHER_STATUS_CACHE_TTL", 2.0) == 2.0
+    monkeypatch.setenv("NEWSCATCHER_STATUS_CACHE_TTL", "nan")
+    assert server.env_float("NEWSCATCHER_STATUS_CACHE_TTL", 2.0) == 2.0
+    monkeypatch.setenv("NEWSCATCHER_STATUS_CACHE_TTL", "0")
+    assert server.env_float("NEWSCATCHER_STATUS_CACHE_TTL", 2.0) == 0.0
+
+
+def test_fetch_all_pages_merges_pages_in_order(stub_api):
+    pages = [
+        {"total_pages": 3, "clusters": [{"cluster_id": "c1"}]},
+        {"total_pages": 3, "clusters": [{"cluster_id": "c2"}]},
+        {"total_pages": 3, "clusters": [{"cluster_id": "c3"}]},
+    ]
+    stub_api(lambda call: pages[call["params"]["page"] - 1])
+
+    merged = asyncio.run(server.fetch_all_pages("key", "job-1"))
+    assert [cluster["cluster_id"] for cluster in merged["clusters"]] == ["c1", "c2", "c3"]
+
+    merged = asyncio.run(server.fetch_all_pages("key", "job-1", max_pages=2))
+    assert [cluster["cluster_id"] for cluster in merged["clusters"]] == ["c1", "c2"]
+
+
+@pytest.mark.parametrize(
+    ("pages", "max_pages", "message"),
+    [
+        ([{"total_pages": 1}], 0, "max_pages must be at least 1"),
+        ([{"total_pages": "many"}], None, "Unexpected total_pages"),
+        ([{"total_pages": 2}, ["not", "a", "page"]], None, "Unexpected API response for page 2"),
+    ],
+)
+def test_fetch_all_pages_rejects_invalid_input(stub_api, pages, max_pages, message):
+    stub_api(lambda call: pages[call["params"]["page"] - 1])
+
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(server.fetch_all_pages("key", "job-1", max_pages))
+
+
+def test_await_completion_polls_the_api_instead_of_the_cache(stub_api, sleeps):
+    statuses = iter(["fetching", "clustering", "completed"])
+    calls = stub_api(lambda call: {"status": next(statuses), "eta_seconds": 1})
+
+    result = asyncio.run(server.await_completion("key", "job-1", max_wait=60))
+
+    assert result["status"] == "completed"
+    # Every poll reaches the API, so there is exactly one sleep between each pair
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+
+def test_await_completion_backoff_ignores_eta_polls(stub_api, sleeps):
+    # Enough ETA-driven polls that advancing the backoff exponent on each one would overflow
+    responses = [{"status": "fetching", "eta_seconds": 4}] * 1100
+    responses += [{"status": "fetching"}] * 8 + [{"status": "completed"}]
+    statuses = iter(responses)
+    stub_api(lambda call: next(statuses))
+
+    result = asyncio.run(server.await_completion("key", "job-1", max_wait=60))
+
+    assert result["status"] == "completed"
+    backoff = sleeps[1100:]
+    assert server.POLL_BASE_DELAY <= backoff[0] <= server.POLL_BASE_DELAY + server.POLL_JITTER
+    assert backoff[-1] == server.POLL_MAX_DELAY
+
+
+@pytest.mark.parametrize("max_wait", [-1, float("nan"), float("inf")])
+def test_await_completion_rejects_invalid_max_wait(stub_api, max_wait):
+    calls = stub_api(lambda call: {"status": "fetching"})
+
+    with pytest.raises(ValueError, match="max_wait"):
+        asyncio.run(server.await_completion("key", "job-1", max_wait))
+    assert calls == []
+
+
+def test_await_completion_clamps_max_wait(monkeypatch, stub_api, sleeps):
+    calls = stub_api(lambda call: {"status": "fetching"})
+    # The clock starts at 0 and then reads POLL_MAX_WAIT for every later call
+    readings = [0.0]
+    clock = lambda: readings.pop() if readings else server.POLL_MAX_WAIT  # noqa: E731
+    # Swap the module's time reference only, the event loop keeps the real clock
+    monkeypatch.setattr(server, "time", SimpleNamespace(monotonic=clock))
+
+    result = asyncio.run(server.await_completion("key", "job-1", max_wait=10**9))
+
+    # The deadline is POLL_MAX_WAIT from the start, so the first poll already hits it
+    assert result["status"] == "fetching"
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_pull_results_pretty_wraps_non_json_bodies(stub_api):
+    stub_api(lambda call: "not json")
+
+    assert asyncio.run(server.pull_results("job-1", api_key="key")) == "not json"
+    assert asyncio.run(server.pull_results("job-1", api_key="key", pretty=True)) == '{\n  "result": "not json"\n}'